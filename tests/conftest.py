@@ -0,0 +1,6 @@
+import pytest
+
+
+@pytest.fixture(name='bcrypt_cache', scope='session')
+def fixture_bcrypt_cache():
+    return {}
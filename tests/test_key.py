@@ -1,4 +1,5 @@
 import base64
+import functools
 
 import pytest
 from openssh_key.key import PrivateKey, PublicKey
@@ -125,7 +126,8 @@ RSA_TEST_PRIVATE = {
 }
 
 
-def correct_public_key_bytes_ed25519(write_byte_stream=None):
+@functools.lru_cache(maxsize=None)
+def _correct_public_key_bytes_ed25519():
     public_key_write_byte_stream = PascalStyleByteStream()
     public_key_write_byte_stream.write_from_format_instructions_dict(
         PublicKey.HEADER_FORMAT_INSTRUCTIONS_DICT,
@@ -137,6 +139,11 @@ def correct_public_key_bytes_ed25519(write_byte_stream=None):
     )
     public_key_bytes = public_key_write_byte_stream.getvalue()
     public_key = PublicKey.from_bytes(public_key_bytes)
+    return public_key_bytes, public_key
+
+
+def correct_public_key_bytes_ed25519(write_byte_stream=None):
+    public_key_bytes, public_key = _correct_public_key_bytes_ed25519()
     if write_byte_stream is not None:
         write_byte_stream.write_from_format_instruction(
             PascalStyleFormatInstruction.BYTES,
@@ -145,7 +152,8 @@ def correct_public_key_bytes_ed25519(write_byte_stream=None):
     return public_key_bytes, public_key
 
 
-def correct_private_key_bytes_ed25519(decipher_byte_stream=None):
+@functools.lru_cache(maxsize=None)
+def _correct_private_key_bytes_ed25519():
     private_key_write_byte_stream = PascalStyleByteStream()
     private_key_write_byte_stream.write_from_format_instructions_dict(
         PrivateKey.HEADER_FORMAT_INSTRUCTIONS_DICT,
@@ -161,12 +169,18 @@ def correct_private_key_bytes_ed25519(decipher_byte_stream=None):
     )
     private_key_bytes = private_key_write_byte_stream.getvalue()
     private_key = PrivateKey.from_bytes(private_key_bytes)
+    return private_key_bytes, private_key
+
+
+def correct_private_key_bytes_ed25519(decipher_byte_stream=None):
+    private_key_bytes, private_key = _correct_private_key_bytes_ed25519()
     if decipher_byte_stream is not None:
         decipher_byte_stream.write(private_key_bytes)
     return private_key_bytes, private_key
 
 
-def correct_public_key_bytes_rsa(write_byte_stream=None):
+@functools.lru_cache(maxsize=None)
+def _correct_public_key_bytes_rsa():
     public_key_write_byte_stream = PascalStyleByteStream()
     public_key_write_byte_stream.write_from_format_instructions_dict(
         PublicKey.HEADER_FORMAT_INSTRUCTIONS_DICT,
@@ -178,6 +192,11 @@ def correct_public_key_bytes_rsa(write_byte_stream=None):
     )
     public_key_bytes = public_key_write_byte_stream.getvalue()
     public_key = PublicKey.from_bytes(public_key_bytes)
+    return public_key_bytes, public_key
+
+
+def correct_public_key_bytes_rsa(write_byte_stream=None):
+    public_key_bytes, public_key = _correct_public_key_bytes_rsa()
     if write_byte_stream is not None:
         write_byte_stream.write_from_format_instruction(
             PascalStyleFormatInstruction.BYTES,
@@ -186,7 +205,8 @@ def correct_public_key_bytes_rsa(write_byte_stream=None):
     return public_key_bytes, public_key
 
 
-def correct_private_key_bytes_rsa(decipher_byte_stream=None):
+@functools.lru_cache(maxsize=None)
+def _correct_private_key_bytes_rsa():
     private_key_write_byte_stream = PascalStyleByteStream()
     private_key_write_byte_stream.write_from_format_instructions_dict(
         PrivateKey.HEADER_FORMAT_INSTRUCTIONS_DICT,
@@ -202,6 +222,11 @@ def correct_private_key_bytes_rsa(decipher_byte_stream=None):
     )
     private_key_bytes = private_key_write_byte_stream.getvalue()
     private_key = PrivateKey.from_bytes(private_key_bytes)
+    return private_key_bytes, private_key
+
+
+def correct_private_key_bytes_rsa(decipher_byte_stream=None):
+    private_key_bytes, private_key = _correct_private_key_bytes_rsa()
     if decipher_byte_stream is not None:
         decipher_byte_stream.write(private_key_bytes)
     return private_key_bytes, private_key
@@ -1,12 +1,13 @@
 import base64
 import getpass
-import secrets
-import warnings
+import random
+import struct
+import typing
 
 import pytest
 from cryptography.hazmat.primitives.asymmetric import rsa
 from openssh_key.cipher import ConfidentialityIntegrityCipher, get_cipher_class
-from openssh_key.kdf_options import get_kdf_options_class
+from openssh_key.kdf_options import BcryptKDFOptions, get_kdf_options_class
 from openssh_key.key import PrivateKey, PublicKey
 from openssh_key.key_params import (Ed25519PublicKeyParams,
                                     RSAPrivateKeyParams, RSAPublicKeyParams,
@@ -25,6 +26,36 @@ from tests.test_key import (ED25519_TEST_HEADER, ED25519_TEST_PRIVATE,
                             correct_public_key_bytes_rsa)
 
 
+class GetpassStub:
+    def __init__(self, return_value):
+        self.return_value = return_value
+        self.call_count = 0
+
+    def __call__(self, _prompt='Password: ', _stream=None):
+        self.call_count += 1
+        return self.return_value
+
+
+@pytest.fixture(name='mock_getpass', autouse=True)
+def fixture_mock_getpass(monkeypatch, request):
+    getpass_stub = GetpassStub(getattr(request, 'param', 'passphrase'))
+    monkeypatch.setattr(getpass, 'getpass', getpass_stub)
+    return getpass_stub
+
+
+@pytest.fixture(name='cache_bcrypt_derive_key', autouse=True)
+def fixture_cache_bcrypt_derive_key(monkeypatch, bcrypt_cache):
+    derive_key = BcryptKDFOptions.derive_key
+
+    def cached_derive_key(self, passphrase, length):
+        key = (passphrase, bytes(self['salt']), self['rounds'], length)
+        if key not in bcrypt_cache:
+            bcrypt_cache[key] = derive_key(self, passphrase, length)
+        return bcrypt_cache[key]
+
+    monkeypatch.setattr(BcryptKDFOptions, 'derive_key', cached_derive_key)
+
+
 def test_public_private_key_pair_generate():
     key_pair = PublicPrivateKeyPair.generate('ssh-rsa')
     assert type(key_pair.private.params) == RSAPrivateKeyParams
@@ -68,6 +99,53 @@ def test_private_key_list_decipher_bytes_format_instructions_dict():
     }
 
 
+_HEADER_FORMAT_INSTRUCTIONS_DICT = \
+    PrivateKeyList.HEADER_FORMAT_INSTRUCTIONS_DICT
+
+_INVERT_TABLE = bytes(byte ^ 255 for byte in range(256))
+
+_PADDING_BYTES = bytes(range(1, 256))
+
+ED25519_KEY_PAIR_TEST = PublicPrivateKeyPair(
+    PublicKey(
+        ED25519_TEST_HEADER,
+        ED25519_TEST_PUBLIC,
+        {}
+    ),
+    PrivateKey(
+        ED25519_TEST_HEADER,
+        ED25519_TEST_PRIVATE,
+        PRIVATE_TEST_FOOTER
+    )
+)
+
+RSA_KEY_PAIR_TEST = PublicPrivateKeyPair(
+    PublicKey(
+        RSA_TEST_HEADER,
+        RSA_TEST_PUBLIC,
+        {}
+    ),
+    PrivateKey(
+        RSA_TEST_HEADER,
+        RSA_TEST_PRIVATE,
+        PRIVATE_TEST_FOOTER
+    )
+)
+
+OVERRIDE_KEY_PAIR_TEST = PublicPrivateKeyPair(
+    RSA_KEY_PAIR_TEST.public,
+    ED25519_KEY_PAIR_TEST.private
+)
+
+
+def _pascal_bytes(value):
+    return struct.pack('>I', len(value)) + value
+
+
+def _pascal_string(value):
+    return _pascal_bytes(value.encode())
+
+
 def correct_header(
         cipher,
         kdf,
@@ -83,15 +161,18 @@ def correct_header(
         'num_keys': num_keys
     }
     if write_byte_stream is not None:
-        write_byte_stream.write_from_format_instructions_dict(
-            PrivateKeyList.HEADER_FORMAT_INSTRUCTIONS_DICT,
-            header
+        write_byte_stream.write(
+            header['auth_magic']
+            + _pascal_string(cipher)
+            + _pascal_string(kdf)
+            + _pascal_bytes(kdf_options_bytes)
+            + struct.pack('>i', num_keys)
         )
     return header
 
 
 BCRYPT_OPTIONS_TEST = {
-    'rounds': 16,
+    'rounds': 1,
     'salt': b'\x8ccm\xe8\x9e\x07H\xfds\xd9[=\rI=\xe8'
 }
 
@@ -112,24 +193,26 @@ def correct_kdf_options_bytes(kdf):
     return kdf_options_bytes, kdf_options
 
 
-def correct_decipher_bytes_header(decipher_byte_stream=None):
-    check_int = secrets.randbits(32)
+@pytest.fixture(name='check_int_random')
+def fixture_check_int_random():
+    return random.Random(0)
+
+
+def correct_decipher_bytes_header(check_int_random, decipher_byte_stream=None):
+    check_int = check_int_random.getrandbits(32)
     decipher_bytes_header = {
         'check_int_1': check_int,
         'check_int_2': check_int
     }
     if decipher_byte_stream is not None:
-        decipher_byte_stream.write_from_format_instructions_dict(
-            PrivateKeyList.DECIPHER_BYTES_HEADER_FORMAT_INSTRUCTIONS_DICT,
-            decipher_bytes_header
-        )
+        decipher_byte_stream.write(struct.pack('>II', check_int, check_int))
     return decipher_bytes_header
 
 
 def correct_decipher_bytes_padding(decipher_byte_stream, cipher, write=False):
     padding_length = (-len(decipher_byte_stream.getvalue())) \
         % get_cipher_class(cipher).BLOCK_SIZE
-    padding_bytes = bytes(range(1, 1 + padding_length))
+    padding_bytes = _PADDING_BYTES[:padding_length]
     if write:
         decipher_byte_stream.write(padding_bytes)
     return padding_bytes
@@ -171,7 +254,6 @@ def correct_cipher_bytes(
 
 def private_key_list_from_bytes_test_assertions(
     write_byte_stream,
-    mocker,
     passphrase,
     pass_passphrase,
     getpass_assert_called,
@@ -184,23 +266,19 @@ def private_key_list_from_bytes_test_assertions(
     decipher_bytes_header,
     padding_bytes
 ):
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
+    byte_string = write_byte_stream.getvalue()
     if pass_passphrase:
         private_key_list = PrivateKeyList.from_bytes(
-            write_byte_stream.getvalue(),
+            byte_string,
             passphrase=passphrase
         )
     else:
-        private_key_list = PrivateKeyList.from_bytes(
-            write_byte_stream.getvalue())
+        private_key_list = PrivateKeyList.from_bytes(byte_string)
 
-    if getpass_assert_called:
-        getpass.getpass.assert_called_once()  # pylint: disable=no-member
-    else:
-        getpass.getpass.assert_not_called()  # pylint: disable=no-member
+    assert getpass.getpass.call_count \
+        == (1 if getpass_assert_called else 0)  # pylint: disable=no-member
 
-    assert private_key_list.byte_string == write_byte_stream.getvalue()
+    assert private_key_list.byte_string == byte_string
     assert private_key_list.header == header
     assert private_key_list.cipher_bytes == cipher_bytes
 
@@ -232,7 +310,7 @@ def test_private_key_list_from_bytes_invalid_auth_magic():
         'num_keys': 0
     }
     write_byte_stream.write_from_format_instructions_dict(
-        PrivateKeyList.HEADER_FORMAT_INSTRUCTIONS_DICT,
+        _HEADER_FORMAT_INSTRUCTIONS_DICT,
         header
     )
     with pytest.raises(ValueError, match='Not an openssh-key-v1 key'):
@@ -255,60 +333,112 @@ def test_private_key_list_from_bytes_negative_num_keys():
         PrivateKeyList.from_bytes(write_byte_stream.getvalue())
 
 
-def test_private_key_list_from_bytes_one_key_none(mocker):
-    kdf = 'none'
-    cipher = 'none'
+class NoneEd25519Bundle(typing.NamedTuple):
+    header: dict
+    kdf_options: dict
+    public_key_bytes: bytes
+    public_key: PublicKey
+    decipher_bytes_header: dict
+    private_key_bytes: bytes
+    private_key: PrivateKey
+    # None writes whichever padding is correct for the private key bytes
+    padding_bytes: typing.Optional[bytes]
+
+    def write(self, write_byte_stream):
+        correct_header(
+            self.header['cipher'],
+            self.header['kdf'],
+            self.header['kdf_options'],
+            self.header['num_keys'],
+            write_byte_stream
+        )
+        write_byte_stream.write_from_format_instruction(
+            PascalStyleFormatInstruction.BYTES,
+            self.public_key_bytes
+        )
+
+        decipher_byte_stream = PascalStyleByteStream()
+        decipher_byte_stream.write(
+            struct.pack(
+                '>II',
+                self.decipher_bytes_header['check_int_1'],
+                self.decipher_bytes_header['check_int_2']
+            )
+        )
+        decipher_byte_stream.write(self.private_key_bytes)
+        if self.padding_bytes is None:
+            correct_decipher_bytes_padding(
+                decipher_byte_stream, 'none', write=True
+            )
+        else:
+            decipher_byte_stream.write(self.padding_bytes)
+
+        cipher_bytes = correct_cipher_bytes(
+            'passphrase',
+            'none',
+            self.kdf_options,
+            'none',
+            decipher_byte_stream,
+            write_byte_stream
+        )
+        return decipher_byte_stream, cipher_bytes
 
-    write_byte_stream = PascalStyleByteStream()
-    kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    header = correct_header(
-        cipher,
-        kdf,
-        kdf_options_bytes,
-        1,
-        write_byte_stream
-    )
 
-    _, public_key = correct_public_key_bytes_ed25519(write_byte_stream)
+@pytest.fixture(name='none_ed25519_bundle', scope='module')
+def fixture_none_ed25519_bundle():
+    kdf_options_bytes, kdf_options = correct_kdf_options_bytes('none')
+    header = correct_header('none', 'none', kdf_options_bytes, 1)
+    public_key_bytes, public_key = correct_public_key_bytes_ed25519()
 
     decipher_byte_stream = PascalStyleByteStream()
-
     decipher_bytes_header = correct_decipher_bytes_header(
+        random.Random(0),
+        decipher_byte_stream
+    )
+    private_key_bytes, private_key = correct_private_key_bytes_ed25519(
         decipher_byte_stream
     )
-    _, private_key = correct_private_key_bytes_ed25519(decipher_byte_stream)
     padding_bytes = correct_decipher_bytes_padding(
-        decipher_byte_stream, cipher, write=True
+        decipher_byte_stream, 'none'
     )
 
-    passphrase = 'passphrase'
-    cipher_bytes = correct_cipher_bytes(
-        passphrase,
-        kdf,
+    return NoneEd25519Bundle(
+        header,
         kdf_options,
-        cipher,
-        decipher_byte_stream,
+        public_key_bytes,
+        public_key,
+        decipher_bytes_header,
+        private_key_bytes,
+        private_key,
+        padding_bytes
+    )
+
+
+def test_private_key_list_from_bytes_one_key_none(none_ed25519_bundle):
+    write_byte_stream = PascalStyleByteStream()
+    decipher_byte_stream, cipher_bytes = none_ed25519_bundle.write(
         write_byte_stream
     )
 
     private_key_list_from_bytes_test_assertions(
         write_byte_stream,
-        mocker,
-        passphrase,
+        'passphrase',
         False,
         False,
-        header,
+        none_ed25519_bundle.header,
         cipher_bytes,
-        [public_key],
-        [private_key],
-        kdf_options,
+        [none_ed25519_bundle.public_key],
+        [none_ed25519_bundle.private_key],
+        none_ed25519_bundle.kdf_options,
         decipher_byte_stream,
-        decipher_bytes_header,
-        padding_bytes
+        none_ed25519_bundle.decipher_bytes_header,
+        none_ed25519_bundle.padding_bytes
     )
 
 
-def test_private_key_list_from_bytes_one_key_bcrypt_aes256ctr(mocker):
+def test_private_key_list_from_bytes_one_key_bcrypt_aes256ctr(
+    check_int_random
+):
     kdf = 'bcrypt'
     cipher = 'aes256-ctr'
 
@@ -327,6 +457,7 @@ def test_private_key_list_from_bytes_one_key_bcrypt_aes256ctr(mocker):
     decipher_byte_stream = PascalStyleByteStream()
 
     decipher_bytes_header = correct_decipher_bytes_header(
+        check_int_random,
         decipher_byte_stream
     )
     _, private_key = correct_private_key_bytes_ed25519(decipher_byte_stream)
@@ -346,7 +477,6 @@ def test_private_key_list_from_bytes_one_key_bcrypt_aes256ctr(mocker):
 
     private_key_list_from_bytes_test_assertions(
         write_byte_stream,
-        mocker,
         passphrase,
         False,
         True,
@@ -361,7 +491,9 @@ def test_private_key_list_from_bytes_one_key_bcrypt_aes256ctr(mocker):
     )
 
 
-def test_private_key_list_from_bytes_one_key_bcrypt_aes256gcm(mocker):
+def test_private_key_list_from_bytes_one_key_bcrypt_aes256gcm(
+    check_int_random
+):
     kdf = 'bcrypt'
     cipher = 'aes256-gcm@openssh.com'
 
@@ -380,6 +512,7 @@ def test_private_key_list_from_bytes_one_key_bcrypt_aes256gcm(mocker):
     decipher_byte_stream = PascalStyleByteStream()
 
     decipher_bytes_header = correct_decipher_bytes_header(
+        check_int_random,
         decipher_byte_stream
     )
     _, private_key = correct_private_key_bytes_ed25519(decipher_byte_stream)
@@ -399,7 +532,6 @@ def test_private_key_list_from_bytes_one_key_bcrypt_aes256gcm(mocker):
 
     private_key_list_from_bytes_test_assertions(
         write_byte_stream,
-        mocker,
         passphrase,
         False,
         True,
@@ -414,7 +546,9 @@ def test_private_key_list_from_bytes_one_key_bcrypt_aes256gcm(mocker):
     )
 
 
-def test_private_key_list_from_bytes_two_keys_bcrypt_aes256ctr(mocker):
+def test_private_key_list_from_bytes_two_keys_bcrypt_aes256ctr(
+    check_int_random
+):
     kdf = 'bcrypt'
     cipher = 'aes256-ctr'
 
@@ -434,6 +568,7 @@ def test_private_key_list_from_bytes_two_keys_bcrypt_aes256ctr(mocker):
     decipher_byte_stream = PascalStyleByteStream()
 
     decipher_bytes_header = correct_decipher_bytes_header(
+        check_int_random,
         decipher_byte_stream
     )
     _, private_key_0 = correct_private_key_bytes_ed25519(decipher_byte_stream)
@@ -454,7 +589,6 @@ def test_private_key_list_from_bytes_two_keys_bcrypt_aes256ctr(mocker):
 
     private_key_list_from_bytes_test_assertions(
         write_byte_stream,
-        mocker,
         passphrase,
         False,
         True,
@@ -469,7 +603,9 @@ def test_private_key_list_from_bytes_two_keys_bcrypt_aes256ctr(mocker):
     )
 
 
-def test_private_key_list_from_bytes_two_keys_bcrypt_aes256gcm(mocker):
+def test_private_key_list_from_bytes_two_keys_bcrypt_aes256gcm(
+    check_int_random
+):
     kdf = 'bcrypt'
     cipher = 'aes256-gcm@openssh.com'
 
@@ -489,6 +625,7 @@ def test_private_key_list_from_bytes_two_keys_bcrypt_aes256gcm(mocker):
     decipher_byte_stream = PascalStyleByteStream()
 
     decipher_bytes_header = correct_decipher_bytes_header(
+        check_int_random,
         decipher_byte_stream
     )
     _, private_key_0 = correct_private_key_bytes_ed25519(decipher_byte_stream)
@@ -509,7 +646,6 @@ def test_private_key_list_from_bytes_two_keys_bcrypt_aes256gcm(mocker):
 
     private_key_list_from_bytes_test_assertions(
         write_byte_stream,
-        mocker,
         passphrase,
         False,
         True,
@@ -524,47 +660,15 @@ def test_private_key_list_from_bytes_two_keys_bcrypt_aes256gcm(mocker):
     )
 
 
-def test_private_key_list_from_bytes_one_key_none_extra_bytes_public_key():
-    kdf = 'none'
-    cipher = 'none'
-
-    write_byte_stream = PascalStyleByteStream()
-    kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    _ = correct_header(
-        cipher,
-        kdf,
-        kdf_options_bytes,
-        1,
-        write_byte_stream
-    )
-
-    public_key_bytes, _ = correct_public_key_bytes_ed25519()
+def test_private_key_list_from_bytes_one_key_none_extra_bytes_public_key(
+    none_ed25519_bundle
+):
     remainder = b'\x00'
-    public_key_bytes += remainder
-    write_byte_stream.write_from_format_instruction(
-        PascalStyleFormatInstruction.BYTES,
-        public_key_bytes
-    )
-
-    decipher_byte_stream = PascalStyleByteStream()
-
-    _ = correct_decipher_bytes_header(
-        decipher_byte_stream
-    )
-    _, _ = correct_private_key_bytes_ed25519(decipher_byte_stream)
-    _ = correct_decipher_bytes_padding(
-        decipher_byte_stream, cipher, write=True
-    )
-
-    passphrase = 'passphrase'
-    _ = correct_cipher_bytes(
-        passphrase,
-        kdf,
-        kdf_options,
-        cipher,
-        decipher_byte_stream,
-        write_byte_stream
+    bundle = none_ed25519_bundle._replace(
+        public_key_bytes=none_ed25519_bundle.public_key_bytes + remainder
     )
+    write_byte_stream = PascalStyleByteStream()
+    bundle.write(write_byte_stream)
 
     with pytest.warns(UserWarning, match='Excess bytes in key'):
         private_key_list = PrivateKeyList.from_bytes(
@@ -574,48 +678,18 @@ def test_private_key_list_from_bytes_one_key_none_extra_bytes_public_key():
     assert private_key_list[0].public.clear['remainder'] == remainder
 
 
-def test_private_key_list_from_bytes_one_key_none_bad_decipher_bytes_header():
-    kdf = 'none'
-    cipher = 'none'
-
-    write_byte_stream = PascalStyleByteStream()
-    kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    _ = correct_header(
-        cipher,
-        kdf,
-        kdf_options_bytes,
-        1,
-        write_byte_stream
-    )
-
-    _, _ = correct_public_key_bytes_ed25519(write_byte_stream)
-
-    decipher_byte_stream = PascalStyleByteStream()
-
-    check_int = secrets.randbits(32)
-    decipher_bytes_header = {
-        'check_int_1': check_int,
-        'check_int_2': check_int ^ 1
-    }
-    decipher_byte_stream.write_from_format_instructions_dict(
-        PrivateKeyList.DECIPHER_BYTES_HEADER_FORMAT_INSTRUCTIONS_DICT,
-        decipher_bytes_header
-    )
-
-    _, _ = correct_private_key_bytes_ed25519(decipher_byte_stream)
-    _ = correct_decipher_bytes_padding(
-        decipher_byte_stream, cipher, write=True
-    )
-
-    passphrase = 'passphrase'
-    _ = correct_cipher_bytes(
-        passphrase,
-        kdf,
-        kdf_options,
-        cipher,
-        decipher_byte_stream,
-        write_byte_stream
+def test_private_key_list_from_bytes_one_key_none_bad_decipher_bytes_header(
+    none_ed25519_bundle
+):
+    check_int = none_ed25519_bundle.decipher_bytes_header['check_int_1']
+    bundle = none_ed25519_bundle._replace(
+        decipher_bytes_header={
+            'check_int_1': check_int,
+            'check_int_2': check_int ^ 1
+        }
     )
+    write_byte_stream = PascalStyleByteStream()
+    bundle.write(write_byte_stream)
 
     with pytest.warns(
         UserWarning,
@@ -624,7 +698,11 @@ def test_private_key_list_from_bytes_one_key_none_bad_decipher_bytes_header():
         PrivateKeyList.from_bytes(write_byte_stream.getvalue())
 
 
-def test_private_key_list_from_bytes_one_key_bcrypt_aes256ctr_bad_passphrase(mocker):
+@pytest.mark.filterwarnings('ignore')
+@pytest.mark.parametrize('mock_getpass', ['wrong_passphrase'], indirect=True)
+def test_private_key_list_from_bytes_one_key_bcrypt_aes256ctr_bad_passphrase(
+    check_int_random
+):
     kdf = 'bcrypt'
     cipher = 'aes256-ctr'
 
@@ -642,7 +720,7 @@ def test_private_key_list_from_bytes_one_key_bcrypt_aes256ctr_bad_passphrase(moc
 
     decipher_byte_stream = PascalStyleByteStream()
 
-    _ = correct_decipher_bytes_header(decipher_byte_stream)
+    _ = correct_decipher_bytes_header(check_int_random, decipher_byte_stream)
     _, _ = correct_private_key_bytes_ed25519(decipher_byte_stream)
     _ = correct_decipher_bytes_padding(
         decipher_byte_stream, cipher, write=True
@@ -658,48 +736,20 @@ def test_private_key_list_from_bytes_one_key_bcrypt_aes256ctr_bad_passphrase(moc
         write_byte_stream
     )
 
-    mocker.patch.object(getpass, 'getpass', return_value='wrong_passphrase')
-
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        with pytest.raises(Exception):
-            PrivateKeyList.from_bytes(write_byte_stream.getvalue())
-
-
-def test_private_key_list_from_bytes_one_key_none_inconsistent_key_types():
-    kdf = 'none'
-    cipher = 'none'
-
-    write_byte_stream = PascalStyleByteStream()
-    kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    _ = correct_header(
-        cipher,
-        kdf,
-        kdf_options_bytes,
-        1,
-        write_byte_stream
-    )
-
-    _, _ = correct_public_key_bytes_ed25519(write_byte_stream)
-
-    decipher_byte_stream = PascalStyleByteStream()
-
-    _ = correct_decipher_bytes_header(decipher_byte_stream)
+    with pytest.raises(Exception):
+        PrivateKeyList.from_bytes(write_byte_stream.getvalue())
 
-    _, _ = correct_private_key_bytes_rsa(decipher_byte_stream)
-    _ = correct_decipher_bytes_padding(
-        decipher_byte_stream, cipher, write=True
-    )
 
-    passphrase = 'passphrase'
-    _ = correct_cipher_bytes(
-        passphrase,
-        kdf,
-        kdf_options,
-        cipher,
-        decipher_byte_stream,
-        write_byte_stream
+def test_private_key_list_from_bytes_one_key_none_inconsistent_key_types(
+    none_ed25519_bundle
+):
+    private_key_bytes, _ = correct_private_key_bytes_rsa()
+    bundle = none_ed25519_bundle._replace(
+        private_key_bytes=private_key_bytes,
+        padding_bytes=None
     )
+    write_byte_stream = PascalStyleByteStream()
+    bundle.write(write_byte_stream)
 
     with pytest.warns(
         UserWarning,
@@ -708,20 +758,9 @@ def test_private_key_list_from_bytes_one_key_none_inconsistent_key_types():
         PrivateKeyList.from_bytes(write_byte_stream.getvalue())
 
 
-def test_private_key_list_from_bytes_one_key_none_inconsistent_key_params():
-    kdf = 'none'
-    cipher = 'none'
-
-    write_byte_stream = PascalStyleByteStream()
-    kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    _ = correct_header(
-        cipher,
-        kdf,
-        kdf_options_bytes,
-        1,
-        write_byte_stream
-    )
-
+def test_private_key_list_from_bytes_one_key_none_inconsistent_key_params(
+    none_ed25519_bundle
+):
     public_key_write_byte_stream = PascalStyleByteStream()
     public_key_header = {
         'key_type': 'ssh-ed25519'
@@ -731,38 +770,17 @@ def test_private_key_list_from_bytes_one_key_none_inconsistent_key_params():
         public_key_header
     )
     public_key_params = {
-        'public': bytes([
-            byte ^ 255 for byte in ED25519_TEST_PUBLIC['public']
-        ])
+        'public': ED25519_TEST_PUBLIC['public'].translate(_INVERT_TABLE)
     }
     public_key_write_byte_stream.write_from_format_instructions_dict(
         Ed25519PublicKeyParams.FORMAT_INSTRUCTIONS_DICT,
         public_key_params
     )
-    public_key_bytes = public_key_write_byte_stream.getvalue()
-    write_byte_stream.write_from_format_instruction(
-        PascalStyleFormatInstruction.BYTES,
-        public_key_bytes
-    )
-
-    decipher_byte_stream = PascalStyleByteStream()
-
-    _ = correct_decipher_bytes_header(decipher_byte_stream)
-
-    _, _ = correct_private_key_bytes_ed25519(decipher_byte_stream)
-    _ = correct_decipher_bytes_padding(
-        decipher_byte_stream, cipher, write=True
-    )
-
-    passphrase = 'passphrase'
-    _ = correct_cipher_bytes(
-        passphrase,
-        kdf,
-        kdf_options,
-        cipher,
-        decipher_byte_stream,
-        write_byte_stream
+    bundle = none_ed25519_bundle._replace(
+        public_key_bytes=public_key_write_byte_stream.getvalue()
     )
+    write_byte_stream = PascalStyleByteStream()
+    bundle.write(write_byte_stream)
 
     with pytest.warns(
         UserWarning,
@@ -771,44 +789,27 @@ def test_private_key_list_from_bytes_one_key_none_inconsistent_key_params():
         PrivateKeyList.from_bytes(write_byte_stream.getvalue())
 
 
-def test_private_key_list_from_bytes_one_key_none_unexpected_padding_bytes():
-    kdf = 'none'
-    cipher = 'none'
+_PADDING_BYTES_MUTATIONS = [
+    pytest.param(
+        lambda padding_bytes: padding_bytes.translate(_INVERT_TABLE),
+        id='unexpected'
+    ),
+    pytest.param(lambda padding_bytes: padding_bytes * 2, id='excess'),
+    pytest.param(lambda _: b'', id='no'),
+    pytest.param(lambda padding_bytes: padding_bytes[:-1], id='insufficient'),
+]
 
-    write_byte_stream = PascalStyleByteStream()
-    kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    _ = correct_header(
-        cipher,
-        kdf,
-        kdf_options_bytes,
-        1,
-        write_byte_stream
-    )
-
-    _ = correct_public_key_bytes_ed25519(write_byte_stream)
-
-    decipher_byte_stream = PascalStyleByteStream()
-
-    _ = correct_decipher_bytes_header(decipher_byte_stream)
-
-    _, _ = correct_private_key_bytes_ed25519(decipher_byte_stream)
-    padding_bytes = correct_decipher_bytes_padding(
-        decipher_byte_stream, cipher, write=False
-    )
-    padding_bytes = bytes([
-        byte ^ 255 for byte in padding_bytes
-    ])
-    decipher_byte_stream.write(padding_bytes)
 
-    passphrase = 'passphrase'
-    _ = correct_cipher_bytes(
-        passphrase,
-        kdf,
-        kdf_options,
-        cipher,
-        decipher_byte_stream,
-        write_byte_stream
+@pytest.mark.parametrize('mutate_padding_bytes', _PADDING_BYTES_MUTATIONS)
+def test_private_key_list_from_bytes_one_key_none_bad_padding_bytes(
+    none_ed25519_bundle,
+    mutate_padding_bytes
+):
+    bundle = none_ed25519_bundle._replace(
+        padding_bytes=mutate_padding_bytes(none_ed25519_bundle.padding_bytes)
     )
+    write_byte_stream = PascalStyleByteStream()
+    bundle.write(write_byte_stream)
 
     with pytest.warns(
         UserWarning,
@@ -817,13 +818,13 @@ def test_private_key_list_from_bytes_one_key_none_unexpected_padding_bytes():
         PrivateKeyList.from_bytes(write_byte_stream.getvalue())
 
 
-def test_private_key_list_from_bytes_one_key_none_excess_padding_bytes():
-    kdf = 'none'
-    cipher = 'none'
+def test_private_key_list_from_bytes_passphrase(check_int_random):
+    kdf = 'bcrypt'
+    cipher = 'aes256-ctr'
 
     write_byte_stream = PascalStyleByteStream()
     kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    _ = correct_header(
+    header = correct_header(
         cipher,
         kdf,
         kdf_options_bytes,
@@ -831,146 +832,21 @@ def test_private_key_list_from_bytes_one_key_none_excess_padding_bytes():
         write_byte_stream
     )
 
-    _ = correct_public_key_bytes_ed25519(write_byte_stream)
+    _, public_key = correct_public_key_bytes_ed25519(write_byte_stream)
 
     decipher_byte_stream = PascalStyleByteStream()
 
-    _ = correct_decipher_bytes_header(decipher_byte_stream)
-
-    _, _ = correct_private_key_bytes_ed25519(decipher_byte_stream)
+    decipher_bytes_header = correct_decipher_bytes_header(
+        check_int_random,
+        decipher_byte_stream
+    )
+    _, private_key = correct_private_key_bytes_ed25519(decipher_byte_stream)
     padding_bytes = correct_decipher_bytes_padding(
-        decipher_byte_stream, cipher, write=False
+        decipher_byte_stream, cipher, write=True
     )
-    decipher_byte_stream.write(padding_bytes + padding_bytes)
 
     passphrase = 'passphrase'
-    _ = correct_cipher_bytes(
-        passphrase,
-        kdf,
-        kdf_options,
-        cipher,
-        decipher_byte_stream,
-        write_byte_stream
-    )
-
-    with pytest.warns(
-        UserWarning,
-        match='Incorrect padding at end of ciphertext'
-    ):
-        PrivateKeyList.from_bytes(write_byte_stream.getvalue())
-
-
-def test_private_key_list_from_bytes_one_key_none_no_padding_bytes():
-    kdf = 'none'
-    cipher = 'none'
-
-    write_byte_stream = PascalStyleByteStream()
-    kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    _ = correct_header(
-        cipher,
-        kdf,
-        kdf_options_bytes,
-        1,
-        write_byte_stream
-    )
-
-    _ = correct_public_key_bytes_ed25519(write_byte_stream)
-
-    decipher_byte_stream = PascalStyleByteStream()
-
-    _ = correct_decipher_bytes_header(decipher_byte_stream)
-
-    _, _ = correct_private_key_bytes_ed25519(decipher_byte_stream)
-
-    passphrase = 'passphrase'
-    _ = correct_cipher_bytes(
-        passphrase,
-        kdf,
-        kdf_options,
-        cipher,
-        decipher_byte_stream,
-        write_byte_stream
-    )
-
-    with pytest.warns(
-        UserWarning,
-        match='Incorrect padding at end of ciphertext'
-    ):
-        PrivateKeyList.from_bytes(write_byte_stream.getvalue())
-
-
-def test_private_key_list_from_bytes_one_key_none_insufficient_padding_bytes():
-    kdf = 'none'
-    cipher = 'none'
-
-    write_byte_stream = PascalStyleByteStream()
-    kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    _ = correct_header(
-        cipher,
-        kdf,
-        kdf_options_bytes,
-        1,
-        write_byte_stream
-    )
-
-    _ = correct_public_key_bytes_ed25519(write_byte_stream)
-
-    decipher_byte_stream = PascalStyleByteStream()
-
-    _ = correct_decipher_bytes_header(decipher_byte_stream)
-
-    _, _ = correct_private_key_bytes_ed25519(decipher_byte_stream)
-
-    padding_bytes = correct_decipher_bytes_padding(
-        decipher_byte_stream, cipher, write=False
-    )
-    decipher_byte_stream.write(padding_bytes[:-1])
-
-    passphrase = 'passphrase'
-    _ = correct_cipher_bytes(
-        passphrase,
-        kdf,
-        kdf_options,
-        cipher,
-        decipher_byte_stream,
-        write_byte_stream
-    )
-
-    with pytest.warns(
-        UserWarning,
-        match='Incorrect padding at end of ciphertext'
-    ):
-        PrivateKeyList.from_bytes(write_byte_stream.getvalue())
-
-
-def test_private_key_list_from_bytes_passphrase(mocker):
-    kdf = 'bcrypt'
-    cipher = 'aes256-ctr'
-
-    write_byte_stream = PascalStyleByteStream()
-    kdf_options_bytes, kdf_options = correct_kdf_options_bytes(kdf)
-    header = correct_header(
-        cipher,
-        kdf,
-        kdf_options_bytes,
-        1,
-        write_byte_stream
-    )
-
-    _, public_key = correct_public_key_bytes_ed25519(write_byte_stream)
-
-    decipher_byte_stream = PascalStyleByteStream()
-
-    decipher_bytes_header = correct_decipher_bytes_header(
-        decipher_byte_stream
-    )
-    _, private_key = correct_private_key_bytes_ed25519(decipher_byte_stream)
-    padding_bytes = correct_decipher_bytes_padding(
-        decipher_byte_stream, cipher, write=True
-    )
-
-    passphrase = 'passphrase'
-    cipher_bytes = correct_cipher_bytes(
+    cipher_bytes = correct_cipher_bytes(
         passphrase,
         kdf,
         kdf_options,
@@ -981,7 +857,6 @@ def test_private_key_list_from_bytes_passphrase(mocker):
 
     private_key_list_from_bytes_test_assertions(
         write_byte_stream,
-        mocker,
         passphrase,
         True,
         False,
@@ -996,36 +871,22 @@ def test_private_key_list_from_bytes_passphrase(mocker):
     )
 
 
-def test_private_key_list_from_string():
-    private_key_list = PrivateKeyList.from_list([
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {},
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER,
-                {}
-            )
-        )
-    ])
-    private_keys_bytes = private_key_list.pack_bytes()
+def correct_private_keys_string(private_keys_bytes):
     private_keys_b64 = base64.b64encode(private_keys_bytes).decode()
-    private_keys_wrapped = ''.join([
-        (
-            private_keys_b64[
-                i:min(i + PrivateKeyList.WRAP_COL, len(private_keys_b64))
-            ] + '\n'
-        )
-        for i in range(0, len(private_keys_b64), PrivateKeyList.WRAP_COL)
-    ])
-    private_keys_string = PrivateKeyList.OPENSSH_PRIVATE_KEY_HEADER + '\n' + \
+    wrap_col = PrivateKeyList.WRAP_COL
+    private_keys_wrapped = '\n'.join(
+        private_keys_b64[i:i + wrap_col]
+        for i in range(0, len(private_keys_b64), wrap_col)
+    )
+    return PrivateKeyList.OPENSSH_PRIVATE_KEY_HEADER + '\n' + \
         private_keys_wrapped + '\n' + \
         PrivateKeyList.OPENSSH_PRIVATE_KEY_FOOTER
+
+
+def test_private_key_list_from_string():
+    private_key_list = PrivateKeyList.from_list([ED25519_KEY_PAIR_TEST])
+    private_keys_bytes = private_key_list.pack_bytes()
+    private_keys_string = correct_private_keys_string(private_keys_bytes)
     assert PrivateKeyList.from_string(private_keys_string) == private_key_list
 
 
@@ -1045,150 +906,60 @@ def test_private_key_list_from_string_incorrect_footer():
         )
 
 
-def test_private_key_list_from_string_passphrase(mocker):
+@pytest.mark.slow
+def test_private_key_list_from_string_passphrase():
     private_key_list = PrivateKeyList.from_list(
-        [
-            PublicPrivateKeyPair(
-                PublicKey(
-                    ED25519_TEST_HEADER,
-                    ED25519_TEST_PUBLIC,
-                    {},
-                    {}
-                ),
-                PrivateKey(
-                    ED25519_TEST_HEADER,
-                    ED25519_TEST_PRIVATE,
-                    PRIVATE_TEST_FOOTER,
-                    {}
-                )
-            )
-        ],
+        [ED25519_KEY_PAIR_TEST],
         'aes256-ctr',
         'bcrypt',
         get_kdf_options_class('bcrypt').generate_options()
     )
     passphrase = 'passphrase'
     private_keys_bytes = private_key_list.pack_bytes(passphrase=passphrase)
-    private_keys_b64 = base64.b64encode(private_keys_bytes).decode()
-    private_keys_wrapped = ''.join([
-        (
-            private_keys_b64[
-                i:min(i + PrivateKeyList.WRAP_COL, len(private_keys_b64))
-            ] + '\n'
-        )
-        for i in range(0, len(private_keys_b64), PrivateKeyList.WRAP_COL)
-    ])
-    private_keys_string = PrivateKeyList.OPENSSH_PRIVATE_KEY_HEADER + '\n' + \
-        private_keys_wrapped + '\n' + \
-        PrivateKeyList.OPENSSH_PRIVATE_KEY_FOOTER
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
+    private_keys_string = correct_private_keys_string(private_keys_bytes)
 
     assert PrivateKeyList.from_string(
         private_keys_string,
         passphrase
     ) == private_key_list
 
-    getpass.getpass.assert_not_called()  # pylint: disable=no-member
-
-
-def test_private_key_list_from_list_one_key():
-    key_pair_0 = PublicPrivateKeyPair(
-        PublicKey(
-            ED25519_TEST_HEADER,
-            ED25519_TEST_PUBLIC,
-            {}
-        ),
-        PrivateKey(
-            ED25519_TEST_HEADER,
-            ED25519_TEST_PRIVATE,
-            PRIVATE_TEST_FOOTER
-        )
-    )
-
-    private_key_list = PrivateKeyList.from_list([key_pair_0])
-
-    assert private_key_list.header == {
-        'cipher': 'none',
-        'kdf': 'none'
-    }
-    assert private_key_list.kdf_options == {}
-    assert private_key_list[0] == key_pair_0
-
-
-def test_private_key_list_from_list_two_keys():
-    key_pair_0 = PublicPrivateKeyPair(
-        PublicKey(
-            ED25519_TEST_HEADER,
-            ED25519_TEST_PUBLIC,
-            {}
-        ),
-        PrivateKey(
-            ED25519_TEST_HEADER,
-            ED25519_TEST_PRIVATE,
-            PRIVATE_TEST_FOOTER
-        )
-    )
-    key_pair_1 = PublicPrivateKeyPair(
-        PublicKey(
-            RSA_TEST_HEADER,
-            RSA_TEST_PUBLIC,
-            {}
-        ),
-        PrivateKey(
-            RSA_TEST_HEADER,
-            RSA_TEST_PRIVATE,
-            PRIVATE_TEST_FOOTER
-        )
-    )
-
-    private_key_list = PrivateKeyList.from_list([key_pair_0, key_pair_1])
-
-    assert private_key_list.header == {
-        'cipher': 'none',
-        'kdf': 'none'
-    }
-    assert private_key_list.kdf_options == {}
-    assert private_key_list[0] == key_pair_0
-    assert private_key_list[1] == key_pair_1
-
-
-def test_private_key_list_from_list_bcrypt_aes256_ctr():
-    key_pair_0 = PublicPrivateKeyPair(
-        PublicKey(
-            ED25519_TEST_HEADER,
-            ED25519_TEST_PUBLIC,
-            {}
-        ),
-        PrivateKey(
-            ED25519_TEST_HEADER,
-            ED25519_TEST_PRIVATE,
-            PRIVATE_TEST_FOOTER
-        )
-    )
-
-    private_key_list = PrivateKeyList.from_list(
-        [key_pair_0],
-        'aes256-ctr',
-        'bcrypt',
-        BCRYPT_OPTIONS_TEST
-    )
+    assert getpass.getpass.call_count == 0  # pylint: disable=no-member
+
+
+@pytest.mark.parametrize('key_pairs', [
+    pytest.param([ED25519_KEY_PAIR_TEST], id='one_key'),
+    pytest.param([ED25519_KEY_PAIR_TEST, RSA_KEY_PAIR_TEST], id='two_keys'),
+])
+@pytest.mark.parametrize('from_list_args,header,kdf_options', [
+    pytest.param(
+        (),
+        {'cipher': 'none', 'kdf': 'none'},
+        {},
+        id='default'
+    ),
+    pytest.param(
+        ('aes256-ctr', 'bcrypt', BCRYPT_OPTIONS_TEST),
+        {'cipher': 'aes256-ctr', 'kdf': 'bcrypt'},
+        BCRYPT_OPTIONS_TEST,
+        id='bcrypt_aes256_ctr'
+    ),
+])
+def test_private_key_list_from_list(
+    key_pairs,
+    from_list_args,
+    header,
+    kdf_options
+):
+    private_key_list = PrivateKeyList.from_list(key_pairs, *from_list_args)
 
-    assert private_key_list.header == {
-        'cipher': 'aes256-ctr',
-        'kdf': 'bcrypt'
-    }
-    assert private_key_list.kdf_options == BCRYPT_OPTIONS_TEST
-    assert private_key_list[0] == key_pair_0
+    assert private_key_list.header == header
+    assert private_key_list.kdf_options == kdf_options
+    assert list(private_key_list) == key_pairs
 
 
 def test_private_key_list_from_list_invalid_private_key():
     key_pair_0 = PublicPrivateKeyPair(
-        PublicKey(
-            ED25519_TEST_HEADER,
-            ED25519_TEST_PUBLIC,
-            {}
-        ),
+        ED25519_KEY_PAIR_TEST.public,
         'not a private key'
     )
 
@@ -1199,11 +970,7 @@ def test_private_key_list_from_list_invalid_private_key():
 def test_private_key_list_from_list_invalid_public_key():
     key_pair_0 = PublicPrivateKeyPair(
         'not a public key',
-        PrivateKey(
-            ED25519_TEST_HEADER,
-            ED25519_TEST_PRIVATE,
-            PRIVATE_TEST_FOOTER
-        )
+        ED25519_KEY_PAIR_TEST.private
     )
 
     with pytest.raises(ValueError, match='Not a key pair'):
@@ -1229,16 +996,28 @@ def private_key_list_pack_bytes_test_assertions(
     assert getpass.getpass.call_count \
         == getpass_assert_call_count  # pylint: disable=no-member
 
+    header = pack_byte_stream.read_from_format_instructions_dict(
+        _HEADER_FORMAT_INSTRUCTIONS_DICT
+    )
+
+    kdf_options_class = get_kdf_options_class(kdf)
+    if kdf_options is None:
+        kdf_options = kdf_options_class(
+            PascalStyleByteStream(
+                header['kdf_options']
+            ).read_from_format_instructions_dict(
+                kdf_options_class.FORMAT_INSTRUCTIONS_DICT
+            )
+        )
+
     kdf_options_byte_stream = PascalStyleByteStream()
     kdf_options_byte_stream.write_from_format_instructions_dict(
-        get_kdf_options_class(kdf).FORMAT_INSTRUCTIONS_DICT,
+        kdf_options_class.FORMAT_INSTRUCTIONS_DICT,
         kdf_options
     )
     kdf_options_bytes = kdf_options_byte_stream.getvalue()
 
-    assert pack_byte_stream.read_from_format_instructions_dict(
-        PrivateKeyList.HEADER_FORMAT_INSTRUCTIONS_DICT
-    ) == {
+    assert header == {
         'auth_magic': b'openssh-key-v1\x00',
         'cipher': cipher,
         'kdf': kdf,
@@ -1276,7 +1055,7 @@ def private_key_list_pack_bytes_test_assertions(
         )
 
     decipher_bytes = cipher_class.decrypt(
-        get_kdf_options_class(kdf)(kdf_options),
+        kdf_options_class(kdf_options),
         passphrase,
         cipher_bytes
     )
@@ -1301,101 +1080,145 @@ def private_key_list_pack_bytes_test_assertions(
         ) == key_pair.private.footer
 
     cipher_block_size = cipher_class.BLOCK_SIZE
-    assert len(decipher_byte_stream.getvalue()) \
-        % cipher_block_size == 0
-    assert bytes(
-        range(1, 1 + cipher_block_size)
-    ).startswith(decipher_byte_stream.read())
+    assert len(decipher_bytes) % cipher_block_size == 0
+    assert _PADDING_BYTES[:cipher_block_size].startswith(
+        decipher_byte_stream.read()
+    )
 
     assert pack_byte_stream.read() == b''
 
+    return kdf_options
 
-def test_private_key_list_pack_bytes_one_key_none(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
 
-    passphrase = 'passphrase'
+def private_key_list_pack_string_test_assertions(
+    pack_string,
+    *args
+):
+    pack_string_lines = pack_string.splitlines()
+    assert pack_string_lines[0] == PrivateKeyList.OPENSSH_PRIVATE_KEY_HEADER
+    assert pack_string_lines[-1] == PrivateKeyList.OPENSSH_PRIVATE_KEY_FOOTER
+    pack_bytes = base64.b64decode(
+        ''.join(pack_string_lines[1:-1])
+    )
+    return private_key_list_pack_bytes_test_assertions(pack_bytes, *args)
 
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
+
+class PackMethod(typing.NamedTuple):
+    pack: typing.Callable
+    assertions: typing.Callable
+
+
+_PACK_METHODS = [
+    pytest.param(
+        PackMethod(
+            PrivateKeyList.pack_bytes,
+            private_key_list_pack_bytes_test_assertions
+        ),
+        id='bytes'
+    ),
+    pytest.param(
+        PackMethod(
+            PrivateKeyList.pack_string,
+            private_key_list_pack_string_test_assertions
+        ),
+        id='string'
+    ),
+]
+
+
+@pytest.mark.parametrize('pack_method', _PACK_METHODS)
+@pytest.mark.parametrize('key_pairs,pack_kwargs,expected_key_pairs', [
+    pytest.param(
+        [ED25519_KEY_PAIR_TEST],
+        {},
+        [ED25519_KEY_PAIR_TEST],
+        id='one_key'
+    ),
+    pytest.param(
+        [ED25519_KEY_PAIR_TEST, RSA_KEY_PAIR_TEST],
+        {},
+        [ED25519_KEY_PAIR_TEST, RSA_KEY_PAIR_TEST],
+        id='two_keys'
+    ),
+    pytest.param(
+        [ED25519_KEY_PAIR_TEST, RSA_KEY_PAIR_TEST],
+        {'include_indices': [1]},
+        [RSA_KEY_PAIR_TEST],
+        id='include_indices'
+    ),
+    pytest.param(
+        [OVERRIDE_KEY_PAIR_TEST],
+        {'override_public_with_private': True},
+        [ED25519_KEY_PAIR_TEST],
+        id='override_public_with_private'
+    ),
+    pytest.param(
+        [OVERRIDE_KEY_PAIR_TEST],
+        {'override_public_with_private': False},
+        [OVERRIDE_KEY_PAIR_TEST],
+        id='no_override_public_with_private'
+    ),
+])
+def test_private_key_list_pack_none(
+    pack_method,
+    key_pairs,
+    pack_kwargs,
+    expected_key_pairs
+):
+    private_key_list = PrivateKeyList.from_list(key_pairs, 'none', 'none', {})
+
+    pack_method.assertions(
+        pack_method.pack(private_key_list, **pack_kwargs),
+        'passphrase',
+        0,
+        'none',
+        'none',
+        expected_key_pairs,
+        {}
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('pack_method', _PACK_METHODS)
+@pytest.mark.parametrize('cipher', [
+    pytest.param('aes256-ctr', id='aes256_ctr'),
+    pytest.param('aes256-gcm@openssh.com', id='aes256_gcm'),
+])
+def test_private_key_list_pack_bcrypt(pack_method, cipher):
+    key_pairs = [ED25519_KEY_PAIR_TEST]
 
     private_key_list = PrivateKeyList.from_list(
         key_pairs,
         cipher,
-        kdf,
-        kdf_options
+        'bcrypt',
+        BCRYPT_OPTIONS_TEST
     )
 
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_bytes = private_key_list.pack_bytes()
-
-    private_key_list_pack_bytes_test_assertions(
-        pack_bytes,
-        passphrase,
-        0,
+    generated_kdf_options = pack_method.assertions(
+        pack_method.pack(private_key_list),
+        'passphrase',
+        1,
         cipher,
-        kdf,
+        'bcrypt',
         key_pairs,
-        kdf_options
+        None
     )
 
+    assert BCRYPT_OPTIONS_TEST != generated_kdf_options
 
-def test_private_key_list_pack_bytes_two_keys_none(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
 
-    passphrase = 'passphrase'
+@pytest.mark.parametrize('pack_method', _PACK_METHODS)
+def test_private_key_list_pack_invalid_include_indices(pack_method):
+    with pytest.raises(IndexError):
+        pack_method.pack(PrivateKeyList.from_list([]), include_indices=[2])
 
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        ),
-        PublicPrivateKeyPair(
-            PublicKey(
-                RSA_TEST_HEADER,
-                RSA_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                RSA_TEST_HEADER,
-                RSA_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
 
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
+def test_private_key_list_pack_bytes_header_none():
+    passphrase = 'passphrase'
 
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
+    key_pairs = [ED25519_KEY_PAIR_TEST]
+
+    private_key_list = PrivateKeyList(key_pairs)
 
     pack_bytes = private_key_list.pack_bytes()
 
@@ -1403,346 +1226,19 @@ def test_private_key_list_pack_bytes_two_keys_none(mocker):
         pack_bytes,
         passphrase,
         0,
-        cipher,
-        kdf,
+        'none',
+        'none',
         key_pairs,
-        kdf_options
+        {}
     )
 
 
-def test_private_key_list_pack_bytes_one_key_bcrypt_aes256_ctr(mocker):
-    cipher = 'aes256-ctr'
-    kdf = 'bcrypt'
-    kdf_options = BCRYPT_OPTIONS_TEST
-
+def test_private_key_list_pack_bytes_header_no_cipher():
     passphrase = 'passphrase'
 
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
+    key_pairs = [ED25519_KEY_PAIR_TEST]
 
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_bytes = private_key_list.pack_bytes()
-
-    generated_kdf_options = PrivateKeyList.from_bytes(pack_bytes).kdf_options
-
-    private_key_list_pack_bytes_test_assertions(
-        pack_bytes,
-        passphrase,
-        2,
-        cipher,
-        kdf,
-        key_pairs,
-        generated_kdf_options
-    )
-
-    assert kdf_options != generated_kdf_options
-
-
-def test_private_key_list_pack_bytes_one_key_bcrypt_aes256_gcm(mocker):
-    cipher = 'aes256-gcm@openssh.com'
-    kdf = 'bcrypt'
-    kdf_options = BCRYPT_OPTIONS_TEST
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_bytes = private_key_list.pack_bytes()
-
-    generated_kdf_options = PrivateKeyList.from_bytes(pack_bytes).kdf_options
-
-    private_key_list_pack_bytes_test_assertions(
-        pack_bytes,
-        passphrase,
-        2,
-        cipher,
-        kdf,
-        key_pairs,
-        generated_kdf_options
-    )
-
-    assert kdf_options != generated_kdf_options
-
-
-def test_private_key_list_pack_bytes_two_keys_include_indices(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_bytes = private_key_list.pack_bytes(include_indices=[0])
-
-    private_key_list_pack_bytes_test_assertions(
-        pack_bytes,
-        passphrase,
-        0,
-        cipher,
-        kdf,
-        [key_pairs[0]],
-        kdf_options
-    )
-
-
-def test_private_key_list_pack_bytes_two_keys_invalid_include_indices(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    with pytest.raises(IndexError):
-        private_key_list.pack_bytes(include_indices=[2])
-
-
-def test_private_key_list_pack_bytes_override_public_with_private(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                RSA_TEST_HEADER,
-                RSA_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_bytes = private_key_list.pack_bytes(override_public_with_private=True)
-
-    private_key_list_pack_bytes_test_assertions(
-        pack_bytes,
-        passphrase,
-        0,
-        cipher,
-        kdf,
-        [
-            PublicPrivateKeyPair(
-                PublicKey(
-                    ED25519_TEST_HEADER,
-                    ED25519_TEST_PUBLIC,
-                    {}
-                ),
-                PrivateKey(
-                    ED25519_TEST_HEADER,
-                    ED25519_TEST_PRIVATE,
-                    PRIVATE_TEST_FOOTER
-                )
-            )
-        ],
-        kdf_options
-    )
-
-
-def test_private_key_list_pack_bytes_no_override_public_with_private(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                RSA_TEST_HEADER,
-                RSA_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_bytes = private_key_list.pack_bytes(
-        override_public_with_private=False)
-
-    private_key_list_pack_bytes_test_assertions(
-        pack_bytes,
-        passphrase,
-        0,
-        cipher,
-        kdf,
-        key_pairs,
-        kdf_options
-    )
-
-
-def test_private_key_list_pack_bytes_header_none(mocker):
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList(key_pairs)
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_bytes = private_key_list.pack_bytes()
-
-    private_key_list_pack_bytes_test_assertions(
-        pack_bytes,
-        passphrase,
-        0,
-        'none',
-        'none',
-        key_pairs,
-        {}
-    )
-
-
-def test_private_key_list_pack_bytes_header_no_cipher(mocker):
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList(key_pairs, header={'kdf': 'bcrypt'})
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
+    private_key_list = PrivateKeyList(key_pairs, header={'kdf': 'bcrypt'})
 
     pack_bytes = private_key_list.pack_bytes()
 
@@ -1757,31 +1253,16 @@ def test_private_key_list_pack_bytes_header_no_cipher(mocker):
     )
 
 
-def test_private_key_list_pack_bytes_header_no_kdf(mocker):
+def test_private_key_list_pack_bytes_header_no_kdf():
     passphrase = 'passphrase'
 
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
+    key_pairs = [ED25519_KEY_PAIR_TEST]
 
     private_key_list = PrivateKeyList(
         key_pairs,
         header={'cipher': 'aes256-ctr'}
     )
 
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
     pack_bytes = private_key_list.pack_bytes()
 
     private_key_list_pack_bytes_test_assertions(
@@ -1795,27 +1276,15 @@ def test_private_key_list_pack_bytes_header_no_kdf(mocker):
     )
 
 
-def test_private_key_list_pack_bytes_header_retain_kdf_options(mocker):
+@pytest.mark.parametrize('pack_method', _PACK_METHODS)
+def test_private_key_list_pack_retain_kdf_options(pack_method):
     cipher = 'aes256-ctr'
     kdf = 'bcrypt'
     kdf_options = BCRYPT_OPTIONS_TEST
 
     passphrase = 'passphrase'
 
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
+    key_pairs = [ED25519_KEY_PAIR_TEST]
 
     private_key_list = PrivateKeyList.from_list(
         key_pairs,
@@ -1824,14 +1293,13 @@ def test_private_key_list_pack_bytes_header_retain_kdf_options(mocker):
         kdf_options
     )
 
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_bytes = private_key_list.pack_bytes(
+    packed = pack_method.pack(
+        private_key_list,
         retain_kdf_options_if_present=True
     )
 
-    private_key_list_pack_bytes_test_assertions(
-        pack_bytes,
+    pack_method.assertions(
+        packed,
         passphrase,
         1,
         cipher,
@@ -1841,282 +1309,16 @@ def test_private_key_list_pack_bytes_header_retain_kdf_options(mocker):
     )
 
 
-def test_private_key_list_pack_bytes_passphrase(mocker):
-    cipher = 'aes256-ctr'
-    kdf = 'bcrypt'
-    kdf_options = BCRYPT_OPTIONS_TEST
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_bytes = private_key_list.pack_bytes(passphrase=passphrase)
-
-    generated_kdf_options = PrivateKeyList.from_bytes(pack_bytes).kdf_options
-
-    private_key_list_pack_bytes_test_assertions(
-        pack_bytes,
-        passphrase,
-        1,
-        cipher,
-        kdf,
-        key_pairs,
-        generated_kdf_options
-    )
-
-    assert kdf_options != generated_kdf_options
-
-
-def private_key_list_pack_string_test_assertions(
-    pack_string,
-    *args
-):
-    pack_string_lines = pack_string.splitlines()
-    assert pack_string_lines[0] == PrivateKeyList.OPENSSH_PRIVATE_KEY_HEADER
-    assert pack_string_lines[-1] == PrivateKeyList.OPENSSH_PRIVATE_KEY_FOOTER
-    pack_bytes = base64.b64decode(
-        ''.join(pack_string_lines[1:-1])
-    )
-    private_key_list_pack_bytes_test_assertions(pack_bytes, *args)
-
-
-def test_private_key_list_pack_string_one_key_none(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_string = private_key_list.pack_string()
-
-    private_key_list_pack_string_test_assertions(
-        pack_string,
-        passphrase,
-        0,
-        cipher,
-        kdf,
-        key_pairs,
-        kdf_options
-    )
-
-
-def test_private_key_list_pack_string_two_keys_none(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        ),
-        PublicPrivateKeyPair(
-            PublicKey(
-                RSA_TEST_HEADER,
-                RSA_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                RSA_TEST_HEADER,
-                RSA_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_string = private_key_list.pack_string()
-
-    private_key_list_pack_string_test_assertions(
-        pack_string,
-        passphrase,
-        0,
-        cipher,
-        kdf,
-        key_pairs,
-        kdf_options
-    )
-
-
-def test_private_key_list_pack_string_one_key_bcrypt_aes256_ctr(mocker):
+@pytest.mark.slow
+@pytest.mark.parametrize('pack_method', _PACK_METHODS)
+def test_private_key_list_pack_passphrase(pack_method):
     cipher = 'aes256-ctr'
     kdf = 'bcrypt'
     kdf_options = BCRYPT_OPTIONS_TEST
 
     passphrase = 'passphrase'
 
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_string = private_key_list.pack_string()
-
-    generated_kdf_options = PrivateKeyList.from_string(pack_string).kdf_options
-
-    private_key_list_pack_string_test_assertions(
-        pack_string,
-        passphrase,
-        2,
-        cipher,
-        kdf,
-        key_pairs,
-        generated_kdf_options
-    )
-
-    assert kdf_options != generated_kdf_options
-
-
-def test_private_key_list_pack_string_two_keys_include_indices(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_string = private_key_list.pack_string()
-
-    private_key_list_pack_string_test_assertions(
-        pack_string,
-        passphrase,
-        0,
-        cipher,
-        kdf,
-        [key_pairs[0]],
-        kdf_options
-    )
-
-
-def test_private_key_list_pack_string_two_keys_invalid_include_indices(
-    mocker
-):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
+    key_pairs = [ED25519_KEY_PAIR_TEST]
 
     private_key_list = PrivateKeyList.from_list(
         key_pairs,
@@ -2125,206 +1327,16 @@ def test_private_key_list_pack_string_two_keys_invalid_include_indices(
         kdf_options
     )
 
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    with pytest.raises(IndexError):
-        private_key_list.pack_string(include_indices=[2])
-
+    packed = pack_method.pack(private_key_list, passphrase=passphrase)
 
-def test_private_key_list_pack_string_override_public_with_private(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                RSA_TEST_HEADER,
-                RSA_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_string = private_key_list.pack_string(
-        override_public_with_private=True
-    )
-
-    private_key_list_pack_string_test_assertions(
-        pack_string,
+    generated_kdf_options = pack_method.assertions(
+        packed,
         passphrase,
         0,
         cipher,
         kdf,
-        [
-            PublicPrivateKeyPair(
-                PublicKey(
-                    ED25519_TEST_HEADER,
-                    ED25519_TEST_PUBLIC,
-                    {}
-                ),
-                PrivateKey(
-                    ED25519_TEST_HEADER,
-                    ED25519_TEST_PRIVATE,
-                    PRIVATE_TEST_FOOTER
-                )
-            )
-        ],
-        kdf_options
-    )
-
-
-def test_private_key_list_pack_string_no_override_public_with_private(mocker):
-    cipher = 'none'
-    kdf = 'none'
-    kdf_options = {}
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                RSA_TEST_HEADER,
-                RSA_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_string = private_key_list.pack_string(
-        override_public_with_private=False
-    )
-
-    private_key_list_pack_string_test_assertions(
-        pack_string,
-        passphrase,
-        0,
-        cipher,
-        kdf,
-        key_pairs,
-        kdf_options
-    )
-
-
-def test_private_key_list_pack_string_one_key_retain_kdf_options(mocker):
-    cipher = 'aes256-ctr'
-    kdf = 'bcrypt'
-    kdf_options = BCRYPT_OPTIONS_TEST
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_string = private_key_list.pack_string(
-        retain_kdf_options_if_present=True
-    )
-
-    private_key_list_pack_string_test_assertions(
-        pack_string,
-        passphrase,
-        1,
-        cipher,
-        kdf,
-        key_pairs,
-        kdf_options
-    )
-
-
-def test_private_key_list_pack_string_passphrase(mocker):
-    cipher = 'aes256-ctr'
-    kdf = 'bcrypt'
-    kdf_options = BCRYPT_OPTIONS_TEST
-
-    passphrase = 'passphrase'
-
-    key_pairs = [
-        PublicPrivateKeyPair(
-            PublicKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PUBLIC,
-                {}
-            ),
-            PrivateKey(
-                ED25519_TEST_HEADER,
-                ED25519_TEST_PRIVATE,
-                PRIVATE_TEST_FOOTER
-            )
-        )
-    ]
-
-    private_key_list = PrivateKeyList.from_list(
-        key_pairs,
-        cipher,
-        kdf,
-        kdf_options
-    )
-
-    mocker.patch.object(getpass, 'getpass', return_value=passphrase)
-
-    pack_string = private_key_list.pack_string(passphrase=passphrase)
-
-    generated_kdf_options = PrivateKeyList.from_string(pack_string).kdf_options
-
-    private_key_list_pack_string_test_assertions(
-        pack_string,
-        passphrase,
-        1,
-        cipher,
-        kdf,
         key_pairs,
-        generated_kdf_options
+        None
     )
 
     assert kdf_options != generated_kdf_options